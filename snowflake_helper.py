@@ -19,36 +19,85 @@
 # source to project. 
 
 import os
+import re
+import uuid
+from tempfile import TemporaryDirectory
+import numpy as np
 import pandas as pd
 import snowflake.connector
 from snowflake.connector.pandas_tools import write_pandas
 from dotenv import load_dotenv
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    import adbc_driver_snowflake.dbapi as adbc_snowflake
+except ImportError:
+    adbc_snowflake = None
+
 load_dotenv()
 
+# Dataframes larger than this (in bytes) are written through a parquet stage
+# rather than write_pandas
+PARQUET_WRITE_THRESHOLD = 100 * 1024 ** 2
+
 # %%
 
 
+_PARENS_RE = re.compile(r'\(([^)]*)\)')
+_GROUP_RE = re.compile(r'^Group$')
+_COL_TRANS = str.maketrans({' ': '_', '%': 'percent'})
+
+
 def rename_cols_for_snowflake(df):
     """Snowflake columns need to adopt certain conventions, such as
     no spaces and no parentheses.
     """
-    df = df.copy()
-    df.columns = (
-        df.columns.str.replace(r'\(([^)]*)\)', r'\1', regex=True)
-        .str.replace(' ', '_', regex=False)
-        .str.replace(r'^Group$', 'Group_Name', regex=True)
-        .str.replace('%', 'percent')
-    )
+    new_cols = [
+        _GROUP_RE.sub('Group_Name', _PARENS_RE.sub(r'\1', col))
+        .translate(_COL_TRANS)
+        for col in df.columns
+    ]
+    # only the column labels change, so a shallow copy shares the data with 
+    # the original frame
+    df = df.copy(deep=False)
+    df.columns = new_cols
     return df
 
 
+def df_to_arrow(df):
+    '''
+    Convert a pandas dataframe to a pyarrow Table, ignoring the index.
+    
+    Numeric numpy-backed columns are wrapped without copying their data 
+    buffers; all other columns are converted by Arrow in a single pass. NaN
+    values are stored as nulls, matching pa.Table.from_pandas.
+    '''
+    arrays = []
+    for i in range(df.shape[1]):
+        col = df.iloc[:, i]
+        if (
+            pd.api.types.is_numeric_dtype(col.dtype)
+            and isinstance(col.dtype, np.dtype)
+        ):
+            arrays.append(pa.array(col.to_numpy(), from_pandas=True))
+        else:
+            arrays.append(pa.array(col, from_pandas=True))
+    return pa.Table.from_arrays(arrays, names=[str(c) for c in df.columns])
+
+
 def csv_to_snowflake(
     csv:'str', 
     table_name:'str', 
     snowflake_connection: 'SnowflakeConnection'
 ):
-    csv_df = pd.read_csv(csv)
+    # multithreaded parse into pyarrow-backed columns, which convert to 
+    # parquet without re-encoding python string objects
+    csv_df = pd.read_csv(csv, engine='pyarrow', dtype_backend='pyarrow')
     snowflake_connection.write_df(
         df=csv_df,
         table_name=table_name, 
@@ -119,24 +168,31 @@ class SnowflakeConnection:
             else:
                 print('Please pass pwd_env.')
                 
-        self.connection = self.create_connection()
+        # created on first access of self.connection
+        self._connection = None
+        # created on first read_table(engine='adbc')
+        self._adbc_connection = None
+
+
+    @property
+    def connection(self):
+        '''
+        Snowflake connection, created the first time it is used.
+        '''
+        if self._connection is None:
+            self._connection = self.create_connection()
+        return self._connection
 
 
     def create_connection(self):
         '''
         Create snowflake connection.
         '''
-        if self.pwd_env is not None:
-            password = os.getenv(self.pwd_env)
-        else:
-            if self.pwd is not None:
-                password = self.pwd
-        
         # Method implementation
         print('Connecting to Snowflake...')
         conn = snowflake.connector.connect(
             user=self.user,
-            password=password,
+            password=self._get_password(),
             account=self.account,
             warehouse=self.warehouse,
             database=self.database,
@@ -147,6 +203,40 @@ class SnowflakeConnection:
         return conn
     
     
+    def create_adbc_connection(self):
+        '''
+        Create snowflake connection using the ADBC driver, which streams 
+        query results as Arrow record batches.
+        '''
+        print('Connecting to Snowflake with ADBC...')
+        conn = adbc_snowflake.connect(
+            db_kwargs={
+                'username': self.user,
+                'password': self._get_password(),
+                'adbc.snowflake.sql.account': self.account,
+                'adbc.snowflake.sql.warehouse': self.warehouse,
+                'adbc.snowflake.sql.db': self.database,
+                'adbc.snowflake.sql.schema': self.schema,
+                # return NUMBER columns as int64/float64 rather than decimal128,
+                # matching the snowflake connector
+                'adbc.snowflake.sql.client_option.use_high_precision': 'false',
+            }
+        )
+        print('Connection successful.')
+        
+        return conn
+    
+    
+    def _get_password(self):
+        '''Get snowflake password from pwd_env, or pwd if passed directly.'''
+        if self.pwd_env is not None:
+            password = os.getenv(self.pwd_env)
+        else:
+            if self.pwd is not None:
+                password = self.pwd
+        return password
+    
+    
     def cursor(self):
         '''
         Pass snowflake connection cursor function, for convenience.
@@ -154,7 +244,15 @@ class SnowflakeConnection:
         return self.connection.cursor()
     
     
-    def write_df(self, df, table_name: 'str', how: 'str'='replace'):
+    def write_df(
+        self, 
+        df, 
+        table_name: 'str', 
+        how: 'str'='replace',
+        chunk_size: 'int' = None,
+        parallel: 'int' = None,
+        verify: 'bool' = True
+    ):
         '''
         Write pandas dataframe to table.
         
@@ -170,18 +268,35 @@ class SnowflakeConnection:
             * append: append data to table in snowflake
             * truncate: will keep all columns from the original table, but otherwise
               replace the table.
+        chunk_size : 'int', default None
+            Number of rows per uploaded parquet file. For dataframes larger 
+            than PARQUET_WRITE_THRESHOLD, defaults to 
+            max(10,000, len(df) // 32), i.e. at most about 32 files uploaded 
+            in parallel. Smaller dataframes are uploaded as a single file by
+            default, since write_pandas uploads chunks one at a time.
+        parallel : 'int', default None
+            Number of threads used to upload files to the stage. Defaults to
+            min(16, 2 * cpu count).
+        verify : 'bool', default True
+            Look up the table's row count before and after writing. Can be 
+            set to False with how='append' to skip these metadata queries, 
+            e.g. for frequent small appends; the write still fails if the 
+            table does not exist.
         '''
+        if parallel is None:
+            parallel = min(16, (os.cpu_count() or 4) * 2)
         
         print(f'---- {how.title()} Table {table_name} ----')
         print(f'Row count of df: {len(df):,}')
         
-        table_exists_bool = self._check_table_exists(table_name)
-        if table_exists_bool:
-            print(f'Note: {table_name} exists')
-            orig_row_count = self._get_table_row_count(table_name)
-            print(f'Original row count in snowflake: {orig_row_count:,}')          
-        else:
-            print(f'{table_name} does not exist')
+        skip_checks = how == 'append' and not verify
+        if not skip_checks:
+            table_exists_bool, orig_row_count, _ = self._table_info(table_name)
+            if table_exists_bool:
+                print(f'Note: {table_name} exists')
+                print(f'Original row count in snowflake: {orig_row_count:,}')          
+            else:
+                print(f'{table_name} does not exist')
         
         if how == 'replace':
             auto_create_table=True
@@ -196,21 +311,141 @@ class SnowflakeConnection:
             print('Please pass appropriate "how" for write_df.')
             return
         
-        print(f'Writing pandas dataframe to snowflake...')
-        success, nchunks, nrows, output_copy_into = write_pandas(
-            conn=self.connection, 
-            df=df,
-            table_name=table_name,
-            quote_identifiers=False,
-            auto_create_table=auto_create_table,
-            overwrite=overwrite
-        )
+        if (
+            pa is not None 
+            and df.memory_usage(deep=True).sum() > PARQUET_WRITE_THRESHOLD
+        ):
+            print(f'Writing pandas dataframe to snowflake via parquet stage...')
+            if chunk_size is None:
+                chunk_size = max(10_000, len(df) // 32)
+            success, nchunks, nrows, output_copy_into = self._write_df_bulk_put(
+                df=df,
+                table_name=table_name,
+                auto_create_table=auto_create_table,
+                overwrite=overwrite,
+                chunk_size=chunk_size,
+                parallel=parallel
+            )
+        else:
+            print(f'Writing pandas dataframe to snowflake...')
+            success, nchunks, nrows, output_copy_into = write_pandas(
+                conn=self.connection, 
+                df=df,
+                table_name=table_name,
+                quote_identifiers=False,
+                auto_create_table=auto_create_table,
+                overwrite=overwrite,
+                chunk_size=chunk_size,
+                parallel=parallel
+            )
         
         print(f'Success: {success}')
         print(f'Rows added: {nrows:,}')
-        new_row_count = self._get_table_row_count(table_name)
-        print(f'Updated row count in snowflake: {new_row_count:,}')
+        if not skip_checks:
+            _, new_row_count, _ = self._table_info(table_name)
+            print(f'Updated row count in snowflake: {new_row_count:,}')
+        
+        
+    def _write_df_bulk_put(
+        self, 
+        df, 
+        table_name: 'str', 
+        auto_create_table: 'bool', 
+        overwrite: 'bool',
+        chunk_size: 'int',
+        parallel: 'int'
+    ):
+        '''
+        Write pandas dataframe to table by saving it as many small 
+        snappy-compressed parquet files, uploading them to a temporary stage 
+        with a single PUT, and loading them with a single COPY INTO. Snowflake
+        uploads the files in parallel and COPY INTO loads them in parallel.
+        
+        Returns the same (success, nchunks, nrows, output) tuple as 
+        write_pandas.
+        '''
+        suffix = uuid.uuid4().hex.upper()
+        stage_name = f'TEMP_STAGE_{suffix}'
+        file_format_name = f'{stage_name}_FORMAT'
+        table_location = f'{self.database}.{self.schema}.{table_name}'
+        # with auto_create_table, load into a new table and only replace the
+        # target once the load has succeeded
+        load_location = (
+            f'{self.database}.{self.schema}.{table_name}_{suffix}'
+            if auto_create_table else table_location
+        )
+        
+        # slices of the arrow table share its buffers, which in turn 
+        # reference the dataframe's numpy arrays
+        tbl = df_to_arrow(df)
+        
+        with TemporaryDirectory() as tmp, self.connection.cursor() as cur:
+            nchunks = 0
+            for start in range(0, len(df), chunk_size):
+                pq.write_table(
+                    tbl.slice(start, chunk_size), 
+                    os.path.join(tmp, f'file{nchunks}.parquet'),
+                    compression='snappy',
+                    use_dictionary=True
+                )
+                nchunks += 1
+            
+            try:
+                cur.execute(f'CREATE TEMPORARY STAGE {stage_name};')
+                tmp_path = tmp.replace('\\', '/')
+                cur.execute(
+                    f"PUT 'file://{tmp_path}/*' @{stage_name}"
+                    f" PARALLEL={parallel} AUTO_COMPRESS=FALSE;"
+                )
+                
+                if auto_create_table:
+                    # infer column types from the staged parquet files
+                    cur.execute(
+                        f'CREATE TEMPORARY FILE FORMAT {file_format_name}'
+                        ' TYPE=PARQUET;'
+                    )
+                    cur.execute(
+                        'SELECT COLUMN_NAME, TYPE FROM TABLE(INFER_SCHEMA('
+                        f"LOCATION=>'@{stage_name}',"
+                        f" FILE_FORMAT=>'{file_format_name}'));"
+                    )
+                    column_types = dict(cur.fetchall())
+                    columns = ', '.join(
+                        f'{col} {column_types[str(col)]}' for col in df.columns
+                    )
+                    cur.execute(f'CREATE TABLE {load_location} ({columns});')
+                elif overwrite:
+                    cur.execute(f'TRUNCATE TABLE {table_location};')
+                
+                cur.execute(
+                    f'COPY INTO {load_location} FROM @{stage_name}'
+                    ' FILE_FORMAT=(TYPE=PARQUET USE_VECTORIZED_SCANNER=TRUE)'
+                    ' MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE PURGE=TRUE;'
+                )
+                output = cur.fetchall()
+                
+                if auto_create_table and all(row[1] == 'LOADED' for row in output):
+                    if self._check_table_exists(table_name):
+                        # atomic; the old data ends up in load_location
+                        cur.execute(
+                            f'ALTER TABLE {load_location}'
+                            f' SWAP WITH {table_location};'
+                        )
+                    else:
+                        cur.execute(
+                            f'ALTER TABLE {load_location}'
+                            f' RENAME TO {table_location};'
+                        )
+            finally:
+                if auto_create_table:
+                    cur.execute(f'DROP TABLE IF EXISTS {load_location};')
+                cur.execute(f'DROP FILE FORMAT IF EXISTS {file_format_name};')
+                cur.execute(f'DROP STAGE IF EXISTS {stage_name};')
         
+        success = all(row[1] == 'LOADED' for row in output)
+        nrows = sum(int(row[3]) for row in output)
+        return success, nchunks, nrows, output
+    
         
     def drop_table(self, table_name:'str'):
         '''Drop table in Snowflake.'''
@@ -223,50 +458,153 @@ class SnowflakeConnection:
             print(f'Table {table_name} does not exist in Snowflake.')
 
             
-    def read_table(self, table_name:'str'):
-        '''Read snowflake table as a pandas dataframe.'''
+    def read_table(self, table_name:'str', engine: 'str' = 'snowflake'):
+        '''
+        Read snowflake table as a pandas dataframe.
+        
+        If pyarrow is available, the result is fetched as an Arrow table and
+        converted without copying, so the returned dataframe uses 
+        pd.ArrowDtype columns (e.g. strings are string[pyarrow], not object).
+        Otherwise falls back to fetch_pandas_all.
+        
+        Parameters
+        ----------
+        table_name : 'str'
+            Name of table in snowflake.
+        engine : {'snowflake', 'adbc'}, default 'snowflake'
+            Driver used to fetch the table. 'adbc' uses the ADBC snowflake
+            driver (adbc-driver-snowflake), which streams Arrow data directly
+            and can be faster for large tables; falls back to the snowflake
+            connector if the driver is not installed.
+        '''
+        if engine == 'adbc':
+            if adbc_snowflake is not None:
+                return self._read_table_adbc(table_name)
+            print(
+                'adbc_driver_snowflake is not installed;'
+                ' using the snowflake connector.'
+            )
+        
         if self._check_table_exists(table_name):
             query = f'SELECT * FROM {self.database}.{self.schema}.{table_name};'
             with self.connection.cursor() as cur:
                 cur.execute(query)
-                read_df = cur.fetch_pandas_all()
+                if pa is None or not hasattr(pd, 'ArrowDtype'):
+                    return cur.fetch_pandas_all()
+                
+                tbl = cur.fetch_arrow_all()
+                if tbl is None:
+                    # fetch_arrow_all returns None for an empty result set
+                    return pd.DataFrame(
+                        columns=[col.name for col in cur.description]
+                    )
+                # self_destruct frees Arrow buffers as pandas blocks are built,
+                # avoiding a 2x peak in memory during conversion
+                read_df = tbl.to_pandas(
+                    split_blocks=True,
+                    self_destruct=True,
+                    types_mapper=pd.ArrowDtype,
+                    use_threads=True
+                )
+                del tbl
                 return read_df
         else:
             print(f'Table {table_name} does not exist in Snowflake')
             return pd.DataFrame()
+    
+    
+    def _read_table_adbc(self, table_name:'str'):
+        '''
+        Read snowflake table as a pandas dataframe using only the ADBC 
+        connection, including the check of whether the table exists.
+        '''
+        if self._adbc_connection is None:
+            self._adbc_connection = self.create_adbc_connection()
+        exists_query = (
+            "SELECT 1 FROM INFORMATION_SCHEMA.TABLES"
+            " WHERE TABLE_CATALOG = CURRENT_DATABASE ()"
+            " AND TABLE_SCHEMA = CURRENT_SCHEMA ()"
+            " AND TABLE_NAME = ? LIMIT 1;"
+        )
+        query = f'SELECT * FROM {self.database}.{self.schema}.{table_name};'
+        with self._adbc_connection.cursor() as cur:
+            cur.execute(exists_query, (table_name.upper(),))
+            if cur.fetchone() is None:
+                print(f'Table {table_name} does not exist in Snowflake')
+                return pd.DataFrame()
+            cur.execute(query)
+            tbl = cur.fetch_arrow_table()
+        read_df = tbl.to_pandas(
+            split_blocks=True,
+            self_destruct=True,
+            types_mapper=pd.ArrowDtype
+        )
+        del tbl
+        return read_df
         
     
     def _check_table_exists(self, table_name:'str', print_query=False):
         '''[Case sensitive] check of whether a table exists'''
         query = (
-            "SELECT * FROM INFORMATION_SCHEMA.TABLES"
+            "SELECT 1 FROM INFORMATION_SCHEMA.TABLES"
             " WHERE TABLE_CATALOG = CURRENT_DATABASE ()"
             " AND TABLE_SCHEMA = CURRENT_SCHEMA ()"
-            f" AND TABLE_NAME = '{table_name.upper()}';"
+            " AND TABLE_NAME = %s LIMIT 1;"
         )
         
         if print_query:
             print(query)
         
-        cur = self.connection.cursor()
-        cur.execute(query)
-        temp_df = cur.fetch_pandas_all()
-        cur.close()
-    
-        # if length of returned dataframe is 0, returns false
-        return bool(len(temp_df))
+        with self.connection.cursor() as cur:
+            cur.execute(query, (table_name.upper(),))
+            return cur.fetchone() is not None
     
-    def _get_table_row_count(self, table_name, print_query=False):
-        '''Get number of rows for a particular table, if it exists; otherwise returns 0'''
-        if self._check_table_exists(table_name):
-            with self.connection.cursor() as cur:
-                query = f'SELECT COUNT(*) AS CNT FROM {self.database}.{self.schema}.{table_name}'
-                cur.execute(query)
-                count_df = cur.fetch_pandas_all()
-                row_count = count_df["CNT"].loc[0]
+    def _get_table_row_count(self, table_name, print_query=False, exact=False):
+        '''
+        Get number of rows for a particular table; the table must exist.
+        
+        By default reads ROW_COUNT from INFORMATION_SCHEMA.TABLES, which is 
+        metadata-only. With exact=True, runs SELECT COUNT(*) on the table.
+        '''
+        if exact:
+            query = f'SELECT COUNT(*) AS CNT FROM {self.database}.{self.schema}.{table_name}'
         else:
-            row_count = 0
+            query = (
+                "SELECT ROW_COUNT AS CNT FROM INFORMATION_SCHEMA.TABLES"
+                " WHERE TABLE_CATALOG = CURRENT_DATABASE ()"
+                " AND TABLE_SCHEMA = CURRENT_SCHEMA ()"
+                " AND TABLE_NAME = %s;"
+            )
+        if print_query:
+            print(query)
+        with self.connection.cursor() as cur:
+            cur.execute(query, None if exact else (table_name.upper(),))
+            row_count = cur.fetchone()[0]
         return row_count
+    
+    def _table_info(self, table_name:'str', print_query=False):
+        '''
+        Get (exists, row_count, last_altered) for a table from a single
+        INFORMATION_SCHEMA.TABLES query. If the table does not exist, returns
+        (False, 0, None).
+        '''
+        query = (
+            "SELECT ROW_COUNT, LAST_ALTERED FROM INFORMATION_SCHEMA.TABLES"
+            " WHERE TABLE_CATALOG = CURRENT_DATABASE ()"
+            " AND TABLE_SCHEMA = CURRENT_SCHEMA ()"
+            " AND TABLE_NAME = %s;"
+        )
+        
+        if print_query:
+            print(query)
+        
+        with self.connection.cursor() as cur:
+            cur.execute(query, (table_name.upper(),))
+            info_row = cur.fetchone()
+        if info_row is None:
+            return False, 0, None
+        row_count, last_altered = info_row
+        return True, row_count, last_altered
 
 
 if __name__ == '__main__':
@@ -301,6 +639,13 @@ if __name__ == '__main__':
         schema='DASHBOARD'
     )
     
+    # resume the warehouse in the background so the first write does not wait
+    # on it
+    with sf_conn.cursor() as cur:
+        cur.execute_async(
+            f'ALTER WAREHOUSE {sf_conn.warehouse} RESUME IF SUSPENDED;'
+        )
+    
     # test the query for checking a table exists; drop if it does
     test_table = 'temp_sf_table'
     sf_conn.drop_table(test_table)
@@ -325,14 +670,87 @@ if __name__ == '__main__':
     print('Replace C; Truncate A')
     sf_conn.write_df(test_df_c, test_table, how='replace')
     sf_conn.write_df(test_df_a, test_table, how='truncate')
-    sf_conn.read_table(test_table)
     print(sf_conn.read_table(test_table))
     
     print('\n------------------')
     print('Replace D; Truncate B')
     sf_conn.write_df(test_df_d, test_table, how='replace')
     sf_conn.write_df(test_df_b, test_table, how='truncate')
-    sf_conn.read_table(test_table)
     print(sf_conn.read_table(test_table))
+    
+    print('\n--------------------------------------------------------------------')
+    print('Testing the same methods through the parquet stage path')
+    default_threshold = PARQUET_WRITE_THRESHOLD
+    PARQUET_WRITE_THRESHOLD = 0
+    
+    # the first replace renames a new table into place; later replaces swap
+    # with the existing table
+    sf_conn.drop_table(test_table)
+    
+    print('\n-------------------')
+    print('Replace A; Append B')
+    sf_conn.write_df(test_df_a, test_table, how='replace')
+    sf_conn.write_df(test_df_b, test_table, how='append')
+    read_df = sf_conn.read_table(test_table)
+    print(read_df)
+    assert len(read_df) == 3 and list(read_df.columns) == ['A', 'B']
+    
+    print('\n------------------')
+    print('Replace C; Append B')
+    sf_conn.write_df(test_df_c, test_table, how='replace')
+    sf_conn.write_df(test_df_b, test_table, how='append')
+    read_df = sf_conn.read_table(test_table)
+    print(read_df)
+    assert len(read_df) == 2 and list(read_df.columns) == ['A', 'B', 'C']
+    
+    print('\n------------------')
+    print('Replace C; Truncate A')
+    sf_conn.write_df(test_df_c, test_table, how='replace')
+    sf_conn.write_df(test_df_a, test_table, how='truncate')
+    read_df = sf_conn.read_table(test_table)
+    print(read_df)
+    assert len(read_df) == 2 and list(read_df.columns) == ['A', 'B', 'C']
+    
+    print('\n------------------')
+    print('Replace D; Truncate B')
+    sf_conn.write_df(test_df_d, test_table, how='replace')
+    sf_conn.write_df(test_df_b, test_table, how='truncate')
+    read_df = sf_conn.read_table(test_table)
+    print(read_df)
+    assert len(read_df) == 1 and list(read_df.columns) == ['A', 'B', 'C']
+    
+    PARQUET_WRITE_THRESHOLD = default_threshold
+    
+    print('\n------------------')
+    print('Replace A; Append B and A without verification')
+    sf_conn.write_df(test_df_a, test_table, how='replace')
+    sf_conn.write_df(test_df_b, test_table, how='append', verify=False)
+    sf_conn.write_df(test_df_a, test_table, how='append', verify=False)
+    read_df = sf_conn.read_table(test_table)
+    print(read_df)
+    assert len(read_df) == 5 and list(read_df.columns) == ['A', 'B']
+    
+    print('\n------------------')
+    print('Append B without verification to a missing table')
+    sf_conn.drop_table(test_table)
+    try:
+        sf_conn.write_df(test_df_b, test_table, how='append', verify=False)
+    except snowflake.connector.errors.ProgrammingError as err:
+        print(f'Failed as expected: {err}')
+    else:
+        raise AssertionError('Append to a missing table should fail')
+    
+    if adbc_snowflake is not None:
+        print('\n------------------')
+        print('Read D with the ADBC driver')
+        sf_conn.write_df(test_df_d, test_table, how='replace')
+        read_df = sf_conn.read_table(test_table)
+        adbc_df = sf_conn.read_table(test_table, engine='adbc')
+        print(adbc_df)
+        print(adbc_df.dtypes)
+        assert adbc_df.shape == read_df.shape
+        assert list(adbc_df.dtypes) == list(read_df.dtypes)
+        sf_conn.drop_table(test_table)
+        assert sf_conn.read_table(test_table, engine='adbc').empty
           
     sf_conn.drop_table(test_table)
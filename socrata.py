@@ -1,17 +1,135 @@
 # %%
 import pandas as pd
+import pyarrow as pa
 import os
+import re
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
+from requests.adapters import HTTPAdapter
 from sodapy import Socrata
 from dotenv import load_dotenv
 import time
-import math
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
 load_dotenv()
 
+SOCRATA_DOMAIN = 'data.cityofnewyork.us'
+# Socrata caps the number of rows returned per request
+PAGE_SIZE = 50_000
+MAX_CONCURRENT_PAGES = 8
+# selects that aggregate or deduplicate rows cannot be ordered by :id
+_AGGREGATE_SELECT_RE = re.compile(
+    r'\bdistinct\b'
+    r'|\b(avg|count|max|min|sum|median|stddev_pop|stddev_samp|extent'
+    r'|convex_hull|regr_\w+)\s*\(',
+    re.IGNORECASE,
+)
+
+def _records_to_df(records: 'list', engine: 'str' = 'pyarrow'):
+    """
+    Create a dataframe from a list of dicts using pyarrow, or polars if 
+    engine='polars' and polars is installed.
+
+    Both infer the schema across all records (Socrata omits null fields, so
+    records can have different keys) and pack each column into a single 
+    buffer; the returned dataframe uses pyarrow-backed columns. Polars runs
+    schema inference across threads. With either engine, falls back to 
+    pd.DataFrame.from_records if a consistent type cannot be inferred (e.g. 
+    nested geometries of different depths).
+    """
+    if not records:
+        return pd.DataFrame()
+    if engine == 'polars':
+        if pl is None:
+            print('polars is not installed; using pyarrow.')
+        else:
+            try:
+                polars_df = pl.from_dicts(records, infer_schema_length=None)
+            except (pl.exceptions.PolarsError, TypeError, ValueError):
+                return pd.DataFrame.from_records(records)
+            return polars_df.to_pandas(use_pyarrow_extension_array=True)
+    try:
+        batch = pa.RecordBatch.from_struct_array(pa.array(records))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pd.DataFrame.from_records(records)
+    tbl = pa.Table.from_batches([batch])
+    del batch
+    return tbl.to_pandas(
+        split_blocks=True,
+        self_destruct=True,
+        types_mapper=pd.ArrowDtype,
+    )
+
+@functools.lru_cache(maxsize=8)
+def _get_socrata_client(domain: 'str', app_token: 'str', timeout: 'int'):
+    """
+    Get a sodapy client for the domain, reusing one client (and its pooled
+    keep-alive connections) across calls with the same domain, token and 
+    timeout.
+    """
+    client = Socrata(domain, app_token, timeout=timeout)
+    client.session.mount(
+        'https://', HTTPAdapter(pool_connections=16, pool_maxsize=32)
+    )
+    return client
+
+async def _fetch_page(session, url, params, offset, semaphore):
+    """Fetch one page of records from a Socrata resource endpoint."""
+    page_params = {**params, '$limit': PAGE_SIZE, '$offset': offset}
+    async with semaphore:
+        async with session.get(url, params=page_params) as response:
+            response.raise_for_status()
+            return await response.json()
+
+async def _fetch_all_pages(url, params, app_token, timeout):
+    """
+    Fetch all records matching params. If the first page is full, count the
+    matching rows and request the remaining pages concurrently.
+    """
+    headers = {'X-App-Token': app_token} if app_token else {}
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+    async with aiohttp.ClientSession(
+        headers=headers, 
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as session:
+        first_page = await _fetch_page(session, url, params, 0, semaphore)
+        if len(first_page) < PAGE_SIZE:
+            return first_page
+
+        count_params = {
+            k: v for k, v in params.items() if k in ('$where', '$q')
+        }
+        count_params['$select'] = 'count(*) AS row_count'
+        async with session.get(url, params=count_params) as response:
+            response.raise_for_status()
+            row_count = int((await response.json())[0]['row_count'])
+
+        pages = await asyncio.gather(*[
+            _fetch_page(session, url, params, offset, semaphore)
+            for offset in range(PAGE_SIZE, row_count, PAGE_SIZE)
+        ])
+    return first_page + [record for page in pages for record in page]
+
+def _run(coro):
+    """Run a coroutine, including from inside a running event loop (e.g. Jupyter)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
 def socrata_api_query(
     dataset_id: 'str',
     token: 'str' = '',
     timeout: 'int' = 30,
+    engine: 'str' = 'pyarrow',
     **kwargs
 ):
     """
@@ -27,6 +145,10 @@ def socrata_api_query(
         token saved in the environment variable 'SOCRATA_APP'
     timeout: int = 30
         API timeout, in seconds.
+    engine: {'pyarrow', 'polars'}, default 'pyarrow'
+        Library used to build the dataframe from the API response. 'polars' 
+        can be faster for large, wide results; falls back to pyarrow if 
+        polars is not installed.
     **kwargs
         Can be used to pass additional socrata app parameters.
 
@@ -35,7 +157,10 @@ def socrata_api_query(
         where : filters the rows to be returned, defaults to limit
         order : specifies the order of results
         group : column to group results on
-        limit : max number of results to return, defaults to 1000
+        limit : max number of results to return. If limit, offset, group 
+            and query are not passed, and select has no aggregates or 
+            distinct, all matching rows are returned, fetched concurrently 
+            in pages of 50,000.
         offset : offset, used for paging. Defaults to 0
         q : performs a full text search for a value
         query : full SoQL query string, all as one parameter
@@ -46,7 +171,8 @@ def socrata_api_query(
     Returns
     -------
     DataFrame
-        A DataFrame created using the Socrata OpenData API
+        A DataFrame created using the Socrata OpenData API, with pyarrow-backed
+        columns.
 
     Examples
     --------
@@ -91,46 +217,66 @@ def socrata_api_query(
         "exclude_system_fields": kwargs.pop("exclude_system_fields", None),
     }
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     print('Running query...')
     
-    client = Socrata("data.cityofnewyork.us", app_token)
-    client.timeout = timeout
+    paginate = (
+        all(params[k] is None for k in ('limit', 'offset', 'group', 'query'))
+        and not _AGGREGATE_SELECT_RE.search(params['select'] or '')
+    )
+    if paginate:
+        page_params = {
+            f'${k}': v for k, v in params.items() 
+            if v is not None and k != 'exclude_system_fields'
+        }
+        # paging requires a stable order; :id breaks ties in the user's order
+        page_params['$order'] = (
+            f"{params['order']}, :id" if params['order'] is not None else ':id'
+        )
+        if params['exclude_system_fields'] is not None:
+            page_params['$$exclude_system_fields'] = (
+                str(params['exclude_system_fields']).lower()
+            )
+        url = f'https://{SOCRATA_DOMAIN}/resource/{dataset_id}.json'
+        try:
+            results = _run(
+                _fetch_all_pages(url, page_params, app_token, timeout)
+            )
+        except aiohttp.ClientResponseError as err:
+            # e.g. an aggregate select that cannot be ordered by :id
+            if err.status != 400:
+                raise
+            print('Paged query was rejected; retrying as a single request.')
+            paginate = False
+    
+    if not paginate:
+        client = _get_socrata_client(SOCRATA_DOMAIN, app_token, timeout)
+        results = client.get(dataset_id, **params)
     
-    results = client.get(dataset_id, **params)
-    opendata_df = pd.DataFrame.from_records(results)
-
-    end_time = time.time()
-    len_time = end_time - start_time
+    opendata_df = _records_to_df(results, engine=engine)
 
-    min_time = math.floor(len_time / 60)
-    print(
-        f'Duration: {min_time} min'
-        f' {len_time - min_time * 60:.4} sec'
-    )
+    len_time = time.perf_counter() - start_time
+    min_time, sec_time = divmod(len_time, 60)
+    print(f'Duration: {int(min_time)} min {sec_time:.4f} sec')
     
     return opendata_df
 
 if __name__ == '__main__':
     print('Geometry of flatbush community distrinct (314)')
-    start_time = time.time()
+    start_time = time.perf_counter()
     od_df = socrata_api_query(
         dataset_id='jp9i-3b7y', 
         timeout=10, 
         where='boro_cd = 314', 
         select='boro_cd, the_geom',
         )
-    end_time = time.time()
+    len_sec = time.perf_counter() - start_time
     print(od_df)
-    len_sec = end_time - start_time
-    min_time = math.floor(len_sec / 60)
-    print(
-        f'Duration: {min_time} min'
-        f' {len_sec - min_time * 60:.4} sec'
-    )
+    min_time, sec_time = divmod(len_sec, 60)
+    print(f'Duration: {int(min_time)} min {sec_time:.4f} sec')
     
     print('\nNumber of SR on July 4th, 2024, by borough')
-    start_time = time.time()
+    start_time = time.perf_counter()
     od_df = socrata_api_query(
         dataset_id='erm2-nwe9',
         timeout=360,
@@ -138,13 +284,9 @@ if __name__ == '__main__':
         where="(date_trunc_ymd(created_date) = '2024-07-04')",
         group="borough",
     )
-    end_time = time.time()
+    len_sec = time.perf_counter() - start_time
     print(od_df)
-    len_sec = end_time - start_time
-    min_time = math.floor(len_sec / 60)
-    print(
-        f'Duration: {min_time} min'
-        f' {len_sec - min_time * 60:.4} sec'
-    )
+    min_time, sec_time = divmod(len_sec, 60)
+    print(f'Duration: {int(min_time)} min {sec_time:.4f} sec')
     
 # %%